@@ -0,0 +1,42 @@
+-- প্রথম রিলিজের স্কিমা। পুরনো ডেটাবেসে এগুলো আগে থেকেই আছে, তাই IF NOT EXISTS।
+-- videos টেবিল আগে তৈরি করা হচ্ছে কারণ users টেবিলের watching_video_id এটিকে রেফার করে
+
+CREATE TABLE IF NOT EXISTS videos (
+    video_id INT AUTO_INCREMENT PRIMARY KEY,
+    youtube_link VARCHAR(512) UNIQUE,
+    duration_seconds INT,
+    points_reward INT
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+CREATE TABLE IF NOT EXISTS users (
+    user_id BIGINT PRIMARY KEY,
+    username VARCHAR(255),
+    points INT DEFAULT 0,
+    referral_code VARCHAR(20) UNIQUE,
+    referred_by BIGINT,
+    channel_joined TINYINT(1) DEFAULT 0, -- MySQL এ BOOLEAN এর জন্য TINYINT(1)
+    watching_video_id INT,
+    video_start_time BIGINT,
+    FOREIGN KEY (referred_by) REFERENCES users(user_id) ON DELETE SET NULL,
+    FOREIGN KEY (watching_video_id) REFERENCES videos(video_id) ON DELETE SET NULL
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+CREATE TABLE IF NOT EXISTS withdrawal_requests (
+    request_id INT AUTO_INCREMENT PRIMARY KEY,
+    user_id BIGINT,
+    bkash_number VARCHAR(20),
+    points_withdrawn INT,
+    amount_taka DECIMAL(10, 2), -- টাকার জন্য DECIMAL ভালো
+    status VARCHAR(50) DEFAULT 'pending',
+    request_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+CREATE TABLE IF NOT EXISTS user_video_watch_history (
+    user_id BIGINT,
+    video_id INT,
+    last_watched_timestamp BIGINT,
+    PRIMARY KEY (user_id, video_id),
+    FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE,
+    FOREIGN KEY (video_id) REFERENCES videos(video_id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
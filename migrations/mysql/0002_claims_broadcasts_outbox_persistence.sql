@@ -0,0 +1,80 @@
+-- মাইগ্রেশন চালু হওয়ার আগে init_db যেসব টেবিল/কলাম যোগ করত। যেসব ডেটাবেসে এগুলো আগে থেকেই আছে
+-- সেখানে "already exists"/"duplicate column" ত্রুটি উপেক্ষা করা হয়।
+
+CREATE TABLE IF NOT EXISTS point_claims (
+    claim_id VARCHAR(64) PRIMARY KEY,
+    user_id BIGINT NOT NULL,
+    video_id INT,
+    points INT,
+    status VARCHAR(32) DEFAULT 'pending_screenshot',
+    telegram_username VARCHAR(255),
+    telegram_fullname VARCHAR(255),
+    screenshot_file_id VARCHAR(255),
+    user_submitted_text TEXT,
+    created_at BIGINT,
+    updated_at BIGINT,
+    INDEX idx_point_claims_status (status, updated_at),
+    FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE,
+    FOREIGN KEY (video_id) REFERENCES videos(video_id) ON DELETE SET NULL
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- ইউজার বট ব্লক করলে ব্রডকাস্টে বাদ যাবে
+ALTER TABLE users ADD COLUMN blocked_bot TINYINT(1) DEFAULT 0;
+
+CREATE TABLE IF NOT EXISTS broadcast_jobs (
+    job_id INT AUTO_INCREMENT PRIMARY KEY,
+    message_text TEXT NOT NULL,
+    status VARCHAR(16) DEFAULT 'running', -- running/done/cancelled
+    admin_chat_id BIGINT,
+    progress_message_id BIGINT,
+    last_user_id BIGINT DEFAULT 0, -- keyset কার্সর: এর পরের user_id থেকে আবার শুরু
+    sent_count INT DEFAULT 0,
+    failed_count INT DEFAULT 0,
+    blocked_count INT DEFAULT 0,
+    created_at BIGINT,
+    updated_at BIGINT,
+    INDEX idx_broadcast_jobs_status (status)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+CREATE TABLE IF NOT EXISTS notification_outbox (
+    notification_id BIGINT AUTO_INCREMENT PRIMARY KEY,
+    chat_id BIGINT NOT NULL,
+    message_text TEXT NOT NULL,
+    parse_mode VARCHAR(16),
+    dedupe_key VARCHAR(128) UNIQUE, -- একই ঘটনার নোটিফিকেশন দুইবার কিউ হবে না
+    status VARCHAR(16) DEFAULT 'pending', -- pending/sending/sent/failed
+    attempts INT DEFAULT 0,
+    next_attempt_at BIGINT,
+    lease_token VARCHAR(32),
+    lease_until BIGINT,
+    last_error VARCHAR(255),
+    created_at BIGINT,
+    sent_at BIGINT,
+    INDEX idx_notification_outbox_due (status, next_attempt_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+CREATE TABLE IF NOT EXISTS bot_user_data (
+    user_id BIGINT PRIMARY KEY,
+    data TEXT NOT NULL, -- JSON
+    updated_at BIGINT
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+CREATE TABLE IF NOT EXISTS bot_conversations (
+    handler_name VARCHAR(64),
+    conversation_key VARCHAR(128), -- JSON, যেমন [chat_id, user_id]
+    state VARCHAR(255) NOT NULL, -- JSON
+    updated_at BIGINT,
+    PRIMARY KEY (handler_name, conversation_key)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+CREATE TABLE IF NOT EXISTS payout_batches (
+    batch_id INT AUTO_INCREMENT PRIMARY KEY,
+    created_at BIGINT,
+    filters VARCHAR(255),
+    request_count INT DEFAULT 0,
+    total_points INT DEFAULT 0,
+    total_taka DECIMAL(12, 2) DEFAULT 0
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- কোন পেআউট ব্যাচে অনুমোদিত হয়েছে
+ALTER TABLE withdrawal_requests ADD COLUMN batch_id INT;
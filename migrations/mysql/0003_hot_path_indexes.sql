@@ -0,0 +1,9 @@
+-- হট কুয়েরিগুলোর ইনডেক্স।
+-- users.referred_by এর জন্য আলাদা ইনডেক্স লাগে না: InnoDB ফরেন কী এর জন্য নিজেই ইনডেক্স তৈরি করে,
+-- যা /reconcilereferrals এর GROUP BY referred_by ব্যবহার করে।
+
+-- /pendingwithdrawals, /approveall: WHERE status = 'pending' ORDER BY request_time, request_id (keyset পেজ)
+CREATE INDEX idx_withdrawal_status_time ON withdrawal_requests (status, request_time, request_id);
+
+-- /payoutcsv: WHERE batch_id = ?
+CREATE INDEX idx_withdrawal_batch ON withdrawal_requests (batch_id);
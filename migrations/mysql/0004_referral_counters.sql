@@ -0,0 +1,7 @@
+-- রেফারারের রো তে রেফারাল সংখ্যা ও মোট কমিশন, যাতে /referral এ COUNT(*) চালাতে না হয়।
+-- আলাদা ALTER, যাতে একটি কলাম আগে থেকে থাকলেও অন্যটি যোগ হয়।
+-- পুরনো ডেটার সংখ্যা মেলাতে অ্যাডমিন একবার /reconcilereferrals চালাবেন।
+
+ALTER TABLE users ADD COLUMN referral_count INT NOT NULL DEFAULT 0;
+
+ALTER TABLE users ADD COLUMN referral_commission INT NOT NULL DEFAULT 0;
@@ -0,0 +1,26 @@
+-- রিটেনশন জব ঠান্ডা রো এখানে সরিয়ে রাখে, যাতে হট টেবিল ছোট থাকে। আর্কাইভে ফরেন কী নেই।
+
+CREATE TABLE IF NOT EXISTS user_video_watch_history_archive (
+    user_id BIGINT,
+    video_id INT,
+    last_watched_timestamp BIGINT,
+    archived_at BIGINT,
+    PRIMARY KEY (user_id, video_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+CREATE TABLE IF NOT EXISTS withdrawal_requests_archive (
+    request_id INT PRIMARY KEY,
+    user_id BIGINT,
+    bkash_number VARCHAR(20),
+    points_withdrawn INT,
+    amount_taka DECIMAL(10, 2),
+    status VARCHAR(50),
+    request_time TIMESTAMP NULL,
+    batch_id INT,
+    archived_at BIGINT,
+    INDEX idx_withdrawal_archive_user (user_id),
+    INDEX idx_withdrawal_archive_batch (batch_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- রিটেনশন জব পুরনো রো খোঁজে last_watched_timestamp দিয়ে
+CREATE INDEX idx_watch_history_time ON user_video_watch_history (last_watched_timestamp);
@@ -0,0 +1,10 @@
+-- FLOOD_SHARED=1 হলে একাধিক রেপ্লিকা এই টেবিল দিয়ে ইউজার প্রতি রেট লিমিট শেয়ার করে (GCRA: theoretical arrival time)।
+-- রিটেনশন জব পুরনো রো মুছে দেয়।
+
+CREATE TABLE IF NOT EXISTS flood_control (
+    user_id BIGINT,
+    action VARCHAR(32),
+    tat DOUBLE NOT NULL,
+    PRIMARY KEY (user_id, action),
+    INDEX idx_flood_control_tat (tat)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
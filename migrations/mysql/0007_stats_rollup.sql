@@ -0,0 +1,68 @@
+-- /stats এর দৈনিক রোলআপ: (দিন, মেট্রিক, শার্ড) প্রতি একটি কাউন্টার, লেখার পথেই একই ট্রানজ্যাকশনে বাড়ানো হয়।
+-- প্রতিটি লেখা একটি র‍্যান্ডম শার্ডে যায় (হট রো লক এড়াতে), /stats শার্ডগুলো যোগ করে পড়ে।
+-- day = 'all' রোতে সর্বমোট (এবং পেন্ডিং পেআউটের মতো বর্তমান মান)। নিচে বিদ্যমান ডেটা থেকে সর্বমোট শার্ড 0 তে ভরে দেওয়া হয়,
+-- দৈনিক রো শুধু এখন থেকে জমবে। প্রতিটি ব্যাকফিল upsert, তাই মাঝপথে ব্যর্থ হলে ফাইলটি আবার চালানো নিরাপদ।
+
+CREATE TABLE IF NOT EXISTS stats_rollup (
+    day VARCHAR(10),
+    metric VARCHAR(64),
+    shard SMALLINT NOT NULL DEFAULT 0,
+    value DECIMAL(16, 2) NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, metric, shard)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+INSERT INTO stats_rollup (day, metric, shard, value)
+    SELECT 'all', 'new_users', 0, COUNT(*) FROM users
+    ON DUPLICATE KEY UPDATE value = VALUES(value);
+
+INSERT INTO stats_rollup (day, metric, shard, value)
+    SELECT 'all', 'referrals', 0, COUNT(*) FROM users WHERE referred_by IS NOT NULL
+    ON DUPLICATE KEY UPDATE value = VALUES(value);
+
+INSERT INTO stats_rollup (day, metric, shard, value)
+    SELECT 'all', 'claims_approved', 0, COUNT(*) FROM point_claims WHERE status = 'approved'
+    ON DUPLICATE KEY UPDATE value = VALUES(value);
+
+INSERT INTO stats_rollup (day, metric, shard, value)
+    SELECT 'all', 'points_issued', 0, COALESCE(SUM(points), 0) FROM point_claims WHERE status = 'approved'
+    ON DUPLICATE KEY UPDATE value = VALUES(value);
+
+INSERT INTO stats_rollup (day, metric, shard, value)
+    SELECT 'all', CONCAT('video_claims:', video_id), 0, COUNT(*) FROM point_claims WHERE status = 'approved' AND video_id IS NOT NULL GROUP BY video_id
+    ON DUPLICATE KEY UPDATE value = VALUES(value);
+
+INSERT INTO stats_rollup (day, metric, shard, value)
+    SELECT 'all', 'withdrawals_requested', 0, COUNT(*) FROM (SELECT request_id FROM withdrawal_requests UNION ALL SELECT request_id FROM withdrawal_requests_archive) w
+    ON DUPLICATE KEY UPDATE value = VALUES(value);
+
+INSERT INTO stats_rollup (day, metric, shard, value)
+    SELECT 'all', 'points_withdrawn', 0, COALESCE(SUM(points_withdrawn), 0) FROM (SELECT points_withdrawn FROM withdrawal_requests UNION ALL SELECT points_withdrawn FROM withdrawal_requests_archive) w
+    ON DUPLICATE KEY UPDATE value = VALUES(value);
+
+INSERT INTO stats_rollup (day, metric, shard, value)
+    SELECT 'all', 'withdrawals_approved', 0, COUNT(*) FROM (SELECT status FROM withdrawal_requests UNION ALL SELECT status FROM withdrawal_requests_archive) w WHERE status = 'approved'
+    ON DUPLICATE KEY UPDATE value = VALUES(value);
+
+INSERT INTO stats_rollup (day, metric, shard, value)
+    SELECT 'all', 'taka_approved', 0, COALESCE(SUM(amount_taka), 0) FROM (SELECT status, amount_taka FROM withdrawal_requests UNION ALL SELECT status, amount_taka FROM withdrawal_requests_archive) w WHERE status = 'approved'
+    ON DUPLICATE KEY UPDATE value = VALUES(value);
+
+INSERT INTO stats_rollup (day, metric, shard, value)
+    SELECT 'all', 'withdrawals_rejected', 0, COUNT(*) FROM (SELECT status FROM withdrawal_requests UNION ALL SELECT status FROM withdrawal_requests_archive) w WHERE status = 'rejected'
+    ON DUPLICATE KEY UPDATE value = VALUES(value);
+
+INSERT INTO stats_rollup (day, metric, shard, value)
+    SELECT 'all', 'points_refunded', 0, COALESCE(SUM(points_withdrawn), 0) FROM (SELECT status, points_withdrawn FROM withdrawal_requests UNION ALL SELECT status, points_withdrawn FROM withdrawal_requests_archive) w WHERE status = 'rejected'
+    ON DUPLICATE KEY UPDATE value = VALUES(value);
+
+INSERT INTO stats_rollup (day, metric, shard, value)
+    SELECT 'all', 'pending_withdrawals', 0, COUNT(*) FROM withdrawal_requests WHERE status = 'pending'
+    ON DUPLICATE KEY UPDATE value = VALUES(value);
+
+INSERT INTO stats_rollup (day, metric, shard, value)
+    SELECT 'all', 'pending_points', 0, COALESCE(SUM(points_withdrawn), 0) FROM withdrawal_requests WHERE status = 'pending'
+    ON DUPLICATE KEY UPDATE value = VALUES(value);
+
+INSERT INTO stats_rollup (day, metric, shard, value)
+    SELECT 'all', 'pending_taka', 0, COALESCE(SUM(amount_taka), 0) FROM withdrawal_requests WHERE status = 'pending'
+    ON DUPLICATE KEY UPDATE value = VALUES(value);
@@ -0,0 +1,4 @@
+-- idx_users_video_start_time কোনো কুয়েরি ব্যবহার করে না, শুধু set/clear_watching_video এর লেখা ধীর করে।
+-- 0003 আর এটি তৈরি করে না; আগের ডেটাবেস থেকে এখানে মুছে ফেলা হয়।
+
+DROP INDEX idx_users_video_start_time ON users;
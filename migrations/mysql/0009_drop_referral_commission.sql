@@ -0,0 +1,3 @@
+-- রেফারাল কমিশন কখনো জমা হয় না, তাই referral_commission সবসময় ০ ছিল আর get_user প্রতিবার অকারণে পড়ত।
+
+ALTER TABLE users DROP COLUMN referral_commission;
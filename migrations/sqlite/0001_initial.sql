@@ -0,0 +1,150 @@
+-- SQLite ব্যাকএন্ডের পুরো স্কিমা, MySQL এর 0001-0005 এর সমতুল্য।
+-- এরপরের প্রতিটি মাইগ্রেশন mysql/ ও sqlite/ দুই ফোল্ডারেই একই নম্বরে যোগ করুন।
+-- সারোগেট কী তে AUTOINCREMENT, যাতে MySQL এর মতো মুছে ফেলা বা আর্কাইভ করা id আর কখনো ফিরে না আসে
+-- (নইলে নতুন withdrawal এর request_id আর্কাইভের পুরনো রো এর সাথে মিলে যেতে পারে)।
+
+CREATE TABLE IF NOT EXISTS videos (
+    video_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    youtube_link VARCHAR(512) UNIQUE,
+    duration_seconds INT,
+    points_reward INT
+);
+
+CREATE TABLE IF NOT EXISTS users (
+    user_id BIGINT PRIMARY KEY,
+    username VARCHAR(255),
+    points INT DEFAULT 0,
+    referral_code VARCHAR(20) UNIQUE,
+    referred_by BIGINT REFERENCES users(user_id) ON DELETE SET NULL,
+    channel_joined TINYINT(1) DEFAULT 0,
+    watching_video_id INT REFERENCES videos(video_id) ON DELETE SET NULL,
+    video_start_time BIGINT,
+    blocked_bot TINYINT(1) DEFAULT 0,
+    referral_count INT NOT NULL DEFAULT 0
+);
+
+-- InnoDB এর মতো ফরেন কী কলামে নিজে থেকে ইনডেক্স হয় না
+CREATE INDEX IF NOT EXISTS idx_users_referred_by ON users (referred_by);
+
+CREATE TABLE IF NOT EXISTS withdrawal_requests (
+    request_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id BIGINT REFERENCES users(user_id) ON DELETE CASCADE,
+    bkash_number VARCHAR(20),
+    points_withdrawn INT,
+    amount_taka DECIMAL(10, 2),
+    status VARCHAR(50) DEFAULT 'pending',
+    request_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP, -- UTC
+    batch_id INT
+);
+
+CREATE INDEX IF NOT EXISTS idx_withdrawal_user ON withdrawal_requests (user_id);
+CREATE INDEX IF NOT EXISTS idx_withdrawal_status_time ON withdrawal_requests (status, request_time, request_id);
+CREATE INDEX IF NOT EXISTS idx_withdrawal_batch ON withdrawal_requests (batch_id);
+
+CREATE TABLE IF NOT EXISTS user_video_watch_history (
+    user_id BIGINT REFERENCES users(user_id) ON DELETE CASCADE,
+    video_id INT REFERENCES videos(video_id) ON DELETE CASCADE,
+    last_watched_timestamp BIGINT,
+    PRIMARY KEY (user_id, video_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_watch_history_video ON user_video_watch_history (video_id);
+CREATE INDEX IF NOT EXISTS idx_watch_history_time ON user_video_watch_history (last_watched_timestamp);
+
+CREATE TABLE IF NOT EXISTS point_claims (
+    claim_id VARCHAR(64) PRIMARY KEY,
+    user_id BIGINT NOT NULL REFERENCES users(user_id) ON DELETE CASCADE,
+    video_id INT REFERENCES videos(video_id) ON DELETE SET NULL,
+    points INT,
+    status VARCHAR(32) DEFAULT 'pending_screenshot',
+    telegram_username VARCHAR(255),
+    telegram_fullname VARCHAR(255),
+    screenshot_file_id VARCHAR(255),
+    user_submitted_text TEXT,
+    created_at BIGINT,
+    updated_at BIGINT
+);
+
+CREATE INDEX IF NOT EXISTS idx_point_claims_status ON point_claims (status, updated_at);
+CREATE INDEX IF NOT EXISTS idx_point_claims_user ON point_claims (user_id);
+CREATE INDEX IF NOT EXISTS idx_point_claims_video ON point_claims (video_id);
+
+CREATE TABLE IF NOT EXISTS broadcast_jobs (
+    job_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    message_text TEXT NOT NULL,
+    status VARCHAR(16) DEFAULT 'running',
+    admin_chat_id BIGINT,
+    progress_message_id BIGINT,
+    last_user_id BIGINT DEFAULT 0,
+    sent_count INT DEFAULT 0,
+    failed_count INT DEFAULT 0,
+    blocked_count INT DEFAULT 0,
+    created_at BIGINT,
+    updated_at BIGINT
+);
+
+CREATE INDEX IF NOT EXISTS idx_broadcast_jobs_status ON broadcast_jobs (status);
+
+CREATE TABLE IF NOT EXISTS notification_outbox (
+    notification_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    chat_id BIGINT NOT NULL,
+    message_text TEXT NOT NULL,
+    parse_mode VARCHAR(16),
+    dedupe_key VARCHAR(128) UNIQUE,
+    status VARCHAR(16) DEFAULT 'pending',
+    attempts INT DEFAULT 0,
+    next_attempt_at BIGINT,
+    lease_token VARCHAR(32),
+    lease_until BIGINT,
+    last_error VARCHAR(255),
+    created_at BIGINT,
+    sent_at BIGINT
+);
+
+CREATE INDEX IF NOT EXISTS idx_notification_outbox_due ON notification_outbox (status, next_attempt_at);
+
+CREATE TABLE IF NOT EXISTS bot_user_data (
+    user_id BIGINT PRIMARY KEY,
+    data TEXT NOT NULL,
+    updated_at BIGINT
+);
+
+CREATE TABLE IF NOT EXISTS bot_conversations (
+    handler_name VARCHAR(64),
+    conversation_key VARCHAR(128),
+    state VARCHAR(255) NOT NULL,
+    updated_at BIGINT,
+    PRIMARY KEY (handler_name, conversation_key)
+);
+
+CREATE TABLE IF NOT EXISTS payout_batches (
+    batch_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created_at BIGINT,
+    filters VARCHAR(255),
+    request_count INT DEFAULT 0,
+    total_points INT DEFAULT 0,
+    total_taka DECIMAL(12, 2) DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS user_video_watch_history_archive (
+    user_id BIGINT,
+    video_id INT,
+    last_watched_timestamp BIGINT,
+    archived_at BIGINT,
+    PRIMARY KEY (user_id, video_id)
+);
+
+CREATE TABLE IF NOT EXISTS withdrawal_requests_archive (
+    request_id INT PRIMARY KEY,
+    user_id BIGINT,
+    bkash_number VARCHAR(20),
+    points_withdrawn INT,
+    amount_taka DECIMAL(10, 2),
+    status VARCHAR(50),
+    request_time TIMESTAMP NULL,
+    batch_id INT,
+    archived_at BIGINT
+);
+
+CREATE INDEX IF NOT EXISTS idx_withdrawal_archive_user ON withdrawal_requests_archive (user_id);
+CREATE INDEX IF NOT EXISTS idx_withdrawal_archive_batch ON withdrawal_requests_archive (batch_id);
@@ -0,0 +1,4 @@
+-- রেফারাল কমিশন কখনো জমা হয় না, তাই referral_commission সবসময় ০ ছিল আর get_user প্রতিবার অকারণে পড়ত।
+-- 0001 আর এটি তৈরি করে না; আগের ডেটাবেস থেকে এখানে মুছে ফেলা হয়।
+
+ALTER TABLE users DROP COLUMN referral_commission;